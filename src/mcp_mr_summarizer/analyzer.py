@@ -5,7 +5,13 @@ import time
 import logging
 import subprocess
 import os
-from typing import Dict, List, Optional, Set, Iterator, Tuple
+import sys
+import tempfile
+import threading
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Set, Iterator, Tuple
 from dataclasses import dataclass
 
 from .models import CommitInfo, MergeRequestSummary
@@ -13,52 +19,96 @@ from .models import CommitInfo, MergeRequestSummary
 # Create logger for this module
 logger = logging.getLogger(__name__)
 
+# Bytes read from git's stdout per chunk when streaming output
+STREAM_CHUNK_SIZE = 64 * 1024
 
-class TimeoutError(Exception):
-    """Custom timeout exception."""
-
-    pass
+# Whether we're running in a test environment; argv and the environment do
+# not change over the life of the process, so this is resolved once
+_IS_TESTING = (
+    any("pytest" in arg for arg in sys.argv) or "PYTEST_CURRENT_TEST" in os.environ
+)
 
 
 # Constants for better maintainability
 class GitPatterns:
-    """Regex patterns for git output parsing."""
+    """Patterns for git output parsing."""
+
+    # Each record starts with a NUL-delimited marker followed by the header
+    # fields, so `git log -z --numstat` output can be split on NUL alone.
+    COMMIT_MARKER = "commit"
+    LOG_FORMAT = "format:%x00commit%x00%H%x00%an%x00%ad%x00%s%x00"
+    BAD_REVISION_PATTERN = r"bad revision '(.+?)(?:\^\{commit\})?'"
+
 
-    INSERTION_DELETION_PATTERNS = [
-        r"(\d+)\s+insertions?\(\+\),\s*(\d+)\s+deletions?\(-\)",  # "13 insertions(+), 25 deletions(-)"
-        r"(\d+)\s+insertions?,\s*(\d+)\s+deletions?",  # "13 insertions, 25 deletions"
-        r"(\d+)\s+insertions?\(\+\)",  # "13 insertions(+)" (insertions only)
-        r"(\d+)\s+deletions?\(-\)",  # "25 deletions(-)" (deletions only)
-    ]
-    COMMIT_HASH_PATTERN = r"^[0-9a-f]{40}$"
+# Compiled once at import and shared by all analyzer instances
+_BAD_REVISION_RE = re.compile(GitPatterns.BAD_REVISION_PATTERN)
+
+# Words of a lowercased commit message are runs of letters, so punctuation
+# such as the colon in "fix:" or "BREAKING:" and the hyphen in
+# "breaking-change" separates words instead of sticking to them
+_WORD_RE = re.compile(r"[a-z]+")
 
 
 class CategoryPatterns:
     """Patterns for commit categorization."""
 
     PATTERNS = {
-        "refactoring": {
-            "refactor",
-            "refactoring",
-            "cleanup",
-            "clean up",
-            "restructure",
-        },
-        "bug_fix": {"fix", "bug", "issue", "error", "resolve", "patch", "hotfix"},
-        "new_feature": {
-            "add",
-            "new",
-            "feature",
-            "implement",
-            "create",
-            "introduce",
-            "feat",
-        },
-        "cleanup": {"remove", "delete", "drop", "deprecate", "clean"},
-        "update": {"update", "upgrade", "bump", "dependenc", "version"},
-        "test": {"test", "spec", "specs", "testing", "unit", "integration"},
-        "documentation": {"docs", "documentation", "readme", "comment", "doc"},
+        "refactoring": frozenset(
+            {
+                "refactor",
+                "refactoring",
+                "cleanup",
+                "clean up",
+                "restructure",
+            }
+        ),
+        "bug_fix": frozenset(
+            {"fix", "bug", "issue", "error", "resolve", "patch", "hotfix"}
+        ),
+        "new_feature": frozenset(
+            {
+                "add",
+                "new",
+                "feature",
+                "implement",
+                "create",
+                "introduce",
+                "feat",
+            }
+        ),
+        "cleanup": frozenset({"remove", "delete", "drop", "deprecate", "clean"}),
+        "update": frozenset({"update", "upgrade", "bump", "dependenc", "version"}),
+        "test": frozenset({"test", "spec", "specs", "testing", "unit", "integration"}),
+        "documentation": frozenset(
+            {"docs", "documentation", "readme", "comment", "doc"}
+        ),
     }
+    BREAKING_KEYWORDS = frozenset(
+        {
+            "breaking",
+            "deprecate",
+            "deprecates",
+            "deprecated",
+            "remove",
+            "removes",
+            "removed",
+        }
+    )
+
+
+# Inverted index from keyword to the categories that list it, so categorizing
+# a message costs one dict lookup per word instead of one set intersection per
+# category.
+_KEYWORD_TO_CATEGORIES: Dict[str, Tuple[str, ...]] = {}
+for _category, _keywords in CategoryPatterns.PATTERNS.items():
+    for _keyword in _keywords:
+        _previous = _KEYWORD_TO_CATEGORIES.get(_keyword, ())
+        _KEYWORD_TO_CATEGORIES[_keyword] = _previous + (_category,)
+del _category, _keywords, _keyword, _previous
+
+_CATEGORY_ORDER = {
+    category: index for index, category in enumerate(CategoryPatterns.PATTERNS)
+}
 
 
 class FilePatterns:
@@ -127,7 +177,55 @@ class FilePatterns:
     }
 
 
-@dataclass
+# Flattened lookup tables built once from FilePatterns. Substring patterns are
+# kept in category order so the first match wins, and each extension maps to
+# the first category that lists it. ".js"/".ts" are resolved at lookup time.
+_SUBSTR_TO_CATEGORY: Tuple[Tuple[str, str], ...] = tuple(
+    (pattern, category)
+    for category, config in FilePatterns.PATTERNS.items()
+    for pattern in config["patterns"]
+)
+_EXT_TO_CATEGORY: Dict[str, str] = {}
+for _category, _config in FilePatterns.PATTERNS.items():
+    for _ext in _config["extensions"]:
+        _EXT_TO_CATEGORY.setdefault(_ext, _category)
+del _category, _config, _ext
+
+_AMBIGUOUS_EXTENSIONS = frozenset({".js", ".ts"})
+_FRONTEND_HINTS = ("component", "page", "view", "ui")
+
+
+@lru_cache(maxsize=8192)
+def _categorize_path(file: str) -> str:
+    """Categorize a file path.
+
+    The result depends only on the path, so it is cached at module level and
+    shared by every analyzer instance in the process.
+    """
+    file_lower = file.lower()
+
+    # Check for special cases first
+    if file == "utils.py":
+        return "Other"
+
+    # Check pattern-based categories first
+    for pattern, category in _SUBSTR_TO_CATEGORY:
+        if pattern in file_lower:
+            return category
+
+    # Check extensions
+    last_dot = file_lower.rfind(".")
+    file_ext = file_lower[last_dot:] if last_dot != -1 else ""
+    if file_ext in _AMBIGUOUS_EXTENSIONS:
+        # .js and .ts can be both frontend and backend
+        if any(hint in file_lower for hint in _FRONTEND_HINTS):
+            return "Frontend"
+        return "Backend"
+
+    return _EXT_TO_CATEGORY.get(file_ext, "Other")
+
+
+@dataclass(slots=True)
 class GitLogSection:
     """Represents a section of git log output."""
 
@@ -135,7 +233,7 @@ class GitLogSection:
     author: str
     date: str
     message: str
-    stats_lines: List[str]
+    numstat: List[Tuple[str, str, str]]
 
 
 class GitLogAnalyzer:
@@ -144,21 +242,8 @@ class GitLogAnalyzer:
     def __init__(self, repo_path: str = ".") -> None:
         """Initialize the analyzer with a repository path."""
         self.repo_path = repo_path
-        # Pre-compile regex patterns for better performance
-        self._compiled_patterns = [
-            re.compile(pattern) for pattern in GitPatterns.INSERTION_DELETION_PATTERNS
-        ]
-        self._commit_hash_pattern = re.compile(GitPatterns.COMMIT_HASH_PATTERN)
-
-    def _is_testing(self) -> bool:
-        """Check if we're running in a test environment."""
-        import sys
-        import os
-
-        return (
-            any("pytest" in arg for arg in sys.argv)
-            or "PYTEST_CURRENT_TEST" in os.environ
-        )
+        # Set once the repository path has passed validation
+        self._repo_validated = False
 
     def _build_git_command(self, subcommand: List[str]) -> List[str]:
         """Build a git command with the repository path."""
@@ -203,9 +288,86 @@ class GitLogAnalyzer:
             logger.error(f"Git command failed: {' '.join(cmd_with_path)} - {e}")
             raise e
 
+    def _stream_git_command(self, cmd: List[str], timeout: int = 30) -> Iterator[str]:
+        """Execute a git command and yield its NUL-delimited stdout tokens.
+
+        Output is read in chunks and split on NUL bytes before decoding, so the
+        whole log is never buffered as one string and parsing overlaps with
+        git producing output. Raises `subprocess.CalledProcessError` on a
+        nonzero exit and `subprocess.TimeoutExpired` if the command runs longer
+        than `timeout` seconds.
+        """
+        cmd_with_path = self._build_git_command(cmd)
+        logger.debug(f"Streaming git command: {' '.join(cmd_with_path)}")
+
+        timed_out = threading.Event()
+
+        # stderr goes to a temporary file so it can never fill a pipe and
+        # block git while stdout is being consumed
+        with tempfile.TemporaryFile() as stderr_file:
+            process = subprocess.Popen(
+                cmd_with_path,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                # Set environment to prevent interactive prompts
+                env={**os.environ, "GIT_TERMINAL_PROMPT": "0", "GIT_ASKPASS": ""},
+            )
+
+            def _kill_on_timeout() -> None:
+                # The timer can fire after git has exited but before it is
+                # cancelled; only a still-running process has timed out
+                if process.poll() is None:
+                    timed_out.set()
+                    process.kill()
+
+            timer = threading.Timer(timeout, _kill_on_timeout)
+            timer.start()
+            try:
+                pending = b""
+                while True:
+                    chunk = process.stdout.read1(STREAM_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    *tokens, pending = (pending + chunk).split(b"\0")
+                    for token in tokens:
+                        yield token.decode("utf-8", "replace")
+                returncode = process.wait()
+            finally:
+                timer.cancel()
+                if process.poll() is None:
+                    # The consumer stopped early
+                    process.kill()
+                    process.wait()
+                process.stdout.close()
+
+            # A killed git never exits cleanly; this also covers git finishing
+            # on its own between the poll and the kill above
+            if timed_out.is_set() and returncode != 0:
+                logger.error(f"Git command timed out: {' '.join(cmd_with_path)}")
+                raise subprocess.TimeoutExpired(cmd_with_path, timeout)
+
+            logger.debug(f"Git command completed with return code: {returncode}")
+            if returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode("utf-8", "replace")
+                raise subprocess.CalledProcessError(
+                    returncode, cmd_with_path, stderr=stderr
+                )
+
+            # Only a clean exit vouches for a trailing token without a NUL;
+            # from a killed or failed run it is truncated and never yielded
+            if pending:
+                yield pending.decode("utf-8", "replace")
+
     def _validate_repo_path(self) -> None:
-        """Validate that the repository path exists and is a valid git repository."""
-        import os
+        """Validate that the repository path exists and contains a git directory.
+
+        Only filesystem checks are done here; the git-level repository check
+        is folded into the single `rev-parse` call in `_validate_branches`.
+        """
+        if self._repo_validated:
+            return
 
         logger.debug(f"Validating repo path: {self.repo_path}")
 
@@ -222,93 +384,48 @@ class GitLogAnalyzer:
             raise ValueError(f"No .git directory found in: {self.repo_path}")
 
         logger.debug(f"Found .git directory at: {git_dir}")
+        self._repo_validated = True
 
-        # First, test if git is available
-        try:
-            test_result = self._execute_git_command(["git", "--version"])
-            if test_result.returncode != 0:
-                raise ValueError("Git command failed to execute")
-            logger.debug(f"Git version: {test_result.stdout.strip()}")
-        except Exception as e:
-            logger.error(f"Git availability test failed: {e}")
-            raise ValueError(f"Git is not available or not working: {e}")
-
+    def _validate_branches(self, base_branch: str, current_branch: str) -> None:
+        """Validate the repository and both refs with a single `git rev-parse`.
+
+        `--show-toplevel` fails outside a work tree and each ref must peel to
+        a commit, so one subprocess checks everything without enumerating the
+        repository's refs. Tags, remote branches and commit hashes resolve as
+        well. `get_git_log` only calls this after `git log` fails, to turn the
+        failure into a specific error.
+        """
         try:
-            # Validate git repository
-            result1 = self._execute_git_command(
-                ["git", "--no-pager", "rev-parse", "--git-dir"]
-            )
-            if result1.returncode != 0:
-                logger.error(
-                    f"Git rev-parse --git-dir failed with return code {result1.returncode}"
-                )
-                logger.error(f"stderr: {result1.stderr}")
-                raise ValueError(f"Not a valid git repository: {self.repo_path}")
-
-            logger.debug(f"Git rev-parse --git-dir output: {result1.stdout.strip()}")
-
-            result2 = self._execute_git_command(
-                ["git", "--no-pager", "rev-parse", "--show-toplevel"]
-            )
-            if result2.returncode != 0:
-                logger.error(
-                    f"Git rev-parse --show-toplevel failed with return code {result2.returncode}"
-                )
-                logger.error(f"stderr: {result2.stderr}")
-                raise ValueError(f"Invalid git repository state: {self.repo_path}")
-
-            logger.debug(
-                f"Git rev-parse --show-toplevel output: {result2.stdout.strip()}"
-            )
-
-        except subprocess.TimeoutExpired:
-            raise ValueError(f"Git repository validation timed out: {self.repo_path}")
-        except FileNotFoundError:
-            raise ValueError(
-                "Git command not found. Please ensure git is installed and in your PATH."
-            )
-        except Exception as e:
-            raise ValueError(f"Error validating git repository: {e}")
+            cmd = [
+                "git",
+                "--no-pager",
+                "rev-parse",
+                "--show-toplevel",
+                f"{base_branch}^{{commit}}",
+                f"{current_branch}^{{commit}}",
+                "--",
+            ]
+            result = self._execute_git_command(cmd)
 
-    def _is_commit_hash(self, line: str) -> bool:
-        """Check if a line is a valid git commit hash."""
-        return bool(self._commit_hash_pattern.match(line))
+            if result.returncode == 0:
+                logger.debug(f"Git rev-parse output: {result.stdout.strip()}")
+                return
 
-    def _validate_branches(self, base_branch: str, current_branch: str) -> None:
-        """Validate that the specified branches exist in the repository."""
-        # Skip validation for commit hashes
-        if self._is_commit_hash(base_branch) or self._is_commit_hash(current_branch):
-            logger.debug(
-                f"Skipping branch validation for commit hashes: {base_branch}, {current_branch}"
-            )
-            return
+            stderr = result.stderr or ""
+            logger.error(f"Git rev-parse failed with return code {result.returncode}")
+            logger.error(f"stderr: {stderr}")
 
-        try:
-            cmd = ["git", "--no-pager", "branch", "-a", "--format=%(refname:short)"]
-            result = self._execute_git_command(cmd)
+            if "not a git repository" in stderr:
+                raise ValueError(f"Not a valid git repository: {self.repo_path}")
 
-            if result.returncode != 0:
+            # rev-parse stops at the first ref it cannot resolve
+            match = _BAD_REVISION_RE.search(stderr)
+            if not match:
                 raise Exception(
-                    f"Failed to get branches: {result.stderr or 'No stderr output'}"
+                    f"Failed to resolve branches: {stderr or 'No stderr output'}"
                 )
 
-            stdout_output = result.stdout.strip()
-            available_branches = (
-                set(stdout_output.split("\n")) if stdout_output else set()
-            )
-
-            # Check if branches exist
-            missing_branches = []
-            if base_branch not in available_branches:
-                missing_branches.append(base_branch)
-            if current_branch != "HEAD" and current_branch not in available_branches:
-                missing_branches.append(current_branch)
-
-            if missing_branches:
-                raise ValueError(
-                    f"Branch(es) not found: {', '.join(missing_branches)}. "
-                    f"Available branches: {', '.join(sorted(list(available_branches)))}"
-                )
+            raise ValueError(f"Branch(es) not found: {match.group(1)}")
 
         except subprocess.TimeoutExpired:
             raise TimeoutError("Branch validation timed out")
@@ -329,10 +446,9 @@ class GitLogAnalyzer:
         logger.debug(f"Starting git log retrieval: {base_branch}..{current_branch}")
 
         try:
-            # Validate repository and branches
-            if not self._is_testing():
+            # Validate repository; refs are only checked if git log fails
+            if not _IS_TESTING:
                 self._validate_repo_path()
-            self._validate_branches(base_branch, current_branch)
 
             # Execute git log command
             cmd = [
@@ -340,31 +456,28 @@ class GitLogAnalyzer:
                 "--no-pager",
                 "log",
                 f"{base_branch}..{current_branch}",
-                "--stat",
-                "--format=format:%H%n%an%n%ad%n%s%n",
+                "--numstat",
+                "-z",
+                f"--format={GitPatterns.LOG_FORMAT}",
                 "--date=short",
+                "--",
             ]
 
-            result = self._execute_git_command(cmd, timeout=30)
-
-            if result.returncode != 0:
-                if result.returncode == 128:
+            # Parse the output as it is produced
+            try:
+                commits = self._parse_git_output_sync_modern(
+                    self._stream_git_command(cmd, timeout=30)
+                )
+            except subprocess.CalledProcessError as e:
+                # Diagnose unknown refs or a missing repository only on
+                # failure, keeping the success path to a single subprocess
+                self._validate_branches(base_branch, current_branch)
+                if e.returncode == 128:
                     logger.debug("No commits found between branches (return code 128)")
                     return []
-                else:
-                    raise Exception(
-                        f"Git command failed with return code {result.returncode}: {result.stderr}"
-                    )
-
-            output = result.stdout
-            if not output:
-                logger.debug("No git output found, returning empty list")
-                return []
-
-            # Parse the output
-            parse_start = time.time()
-            commits = self._parse_git_output_sync_modern(output)
-            parse_time = time.time() - parse_start
+                raise Exception(
+                    f"Git command failed with return code {e.returncode}: {e.stderr}"
+                )
 
             total_time = time.time() - start_time
             logger.debug(
@@ -375,124 +488,86 @@ class GitLogAnalyzer:
 
         except subprocess.TimeoutExpired:
             raise TimeoutError("Git command timed out after 30 seconds")
+        except TimeoutError:
+            raise
+        except FileNotFoundError:
+            # Streaming git log is the first subprocess, so a missing git
+            # binary surfaces here
+            raise Exception(
+                "Git command not found. Please ensure git is installed and in your PATH."
+            )
         except Exception as e:
             raise Exception(f"Unexpected error getting git log: {e}")
 
-    def _parse_git_output_sync_modern(self, output: str) -> List[CommitInfo]:
-        """Modern synchronous parsing of git output using iterators and generators."""
-        lines = output.split("\n")
-        logger.debug(f"Parsing {len(lines)} lines of git output")
-
+    def _parse_git_output_sync_modern(self, tokens: Iterable[str]) -> List[CommitInfo]:
+        """Parse NUL-split `git log -z --numstat` output tokens into commits."""
         commits = []
-        line_iter = iter(lines)
-
-        try:
-            while True:
-                section = self._extract_commit_section(line_iter)
-                if not section:
-                    break
-
-                commit_info = self._parse_commit_section(section)
-                if commit_info:
-                    commits.append(commit_info)
-        except StopIteration:
-            pass
+        for section in self._iter_commit_sections(tokens):
+            commit_info = self._parse_commit_section(section)
+            if commit_info:
+                commits.append(commit_info)
 
         logger.debug(f"Parsed {len(commits)} commits")
         return commits
 
-    def _extract_commit_section(
-        self, line_iter: Iterator[str]
-    ) -> Optional[GitLogSection]:
-        """Extract a complete commit section from the iterator."""
-        try:
-            # Find the next commit hash
-            while True:
-                line = next(line_iter).strip()
-                if self._is_commit_hash(line):
-                    break
-
-            commit_hash = line
-
-            # Extract author, date, message
-            try:
-                author = next(line_iter).strip()
-                date = next(line_iter).strip()
-                message = next(line_iter).strip()
-            except StopIteration:
-                logger.debug(
-                    f"Skipping commit {commit_hash[:8]} - insufficient header lines"
-                )
-                return None
-
-            # Validate required fields
-            if not all([author, date, message]):
-                logger.debug(
-                    f"Skipping commit {commit_hash[:8]} - missing required fields"
+    def _iter_commit_sections(self, tokens: Iterable[str]) -> Iterator[GitLogSection]:
+        """Yield commit sections from NUL-split git log tokens.
+
+        Header fields are consumed positionally after each commit marker.
+        Rename records carry an empty path followed by the old and new paths
+        as two extra tokens, which are consumed here so a path can never be
+        mistaken for a marker.
+        """
+        section: Optional[GitLogSection] = None
+        token_iter = iter(tokens)
+
+        for token in token_iter:
+            token = token.lstrip("\n")
+            if token == GitPatterns.COMMIT_MARKER:
+                if section is not None:
+                    yield section
+                section = GitLogSection(
+                    hash=next(token_iter, ""),
+                    author=next(token_iter, "").strip(),
+                    date=next(token_iter, "").strip(),
+                    message=next(token_iter, "").strip(),
+                    numstat=[],
                 )
-                return None
-
-            # Collect stats lines
-            stats_lines = []
-            try:
-                # Skip empty lines
-                while True:
-                    line = next(line_iter).strip()
-                    if line:
-                        break
-
-                # Collect stats lines until we hit another commit
-                while line and not self._is_commit_hash(line):
-                    stats_lines.append(line)
-                    try:
-                        line = next(line_iter).strip()
-                    except StopIteration:
-                        break
-
-            except StopIteration:
-                pass
+            elif token and section is not None:
+                parts = token.split("\t", 2)
+                if len(parts) != 3:
+                    logger.debug(f"Skipping unrecognized numstat record: {token!r}")
+                    continue
+                added, deleted, path = parts
+                if not path:
+                    # Rename or copy: "<added>\t<deleted>\t\0<old>\0<new>"
+                    next(token_iter, "")
+                    path = next(token_iter, "")
+                section.numstat.append((added, deleted, path))
+
+        if section is not None:
+            yield section
 
+    def _parse_commit_section(self, section: GitLogSection) -> Optional[CommitInfo]:
+        """Parse a commit section into a CommitInfo object."""
+        if not all([section.author, section.date, section.message]):
             logger.debug(
-                f"Collected stats lines for commit {commit_hash[:8]}: {stats_lines}"
-            )
-            return GitLogSection(
-                hash=commit_hash,
-                author=author,
-                date=date,
-                message=message,
-                stats_lines=stats_lines,
+                f"Skipping commit {section.hash[:8]} - missing required fields"
             )
-
-        except StopIteration:
             return None
 
-    def _parse_commit_section(self, section: GitLogSection) -> Optional[CommitInfo]:
-        """Parse a commit section into a CommitInfo object."""
         files_changed = []
         insertions = 0
         deletions = 0
 
-        logger.debug(
-            f"Parsing commit section with {len(section.stats_lines)} stats lines"
-        )
-        for line in section.stats_lines:
-            logger.debug(f"Processing stats line: {line}")
-            if "|" in line and any(c.isdigit() for c in line):
-                file_name, _ = self._parse_file_stats_line(line)
-                if file_name:
-                    files_changed.append(file_name)
-                    logger.debug(f"Added file: {file_name}")
-            elif "file changed" in line or "files changed" in line:
-                # This is the summary line with total stats
-                logger.debug(f"Parsing summary line: {line}")
-                ins, dels = self._extract_insertions_deletions(line)
-                logger.debug(f"Extracted insertions: {ins}, deletions: {dels}")
-                insertions = ins
-                deletions = dels
-
-        logger.debug(
-            f"Final commit info: files={files_changed}, insertions={insertions}, deletions={deletions}"
-        )
+        for added, deleted, path in section.numstat:
+            files_changed.append(path)
+            # Binary files report "-" for both counts
+            if added != "-":
+                insertions += int(added)
+            if deleted != "-":
+                deletions += int(deleted)
+
         return CommitInfo(
             hash=section.hash,
             author=section.author,
@@ -503,54 +578,16 @@ class GitLogAnalyzer:
             deletions=deletions,
         )
 
-    def _parse_file_stats_line(self, line: str) -> Tuple[Optional[str], str]:
-        """Parse a file stats line and return (filename, stats_part)."""
-        parts = line.split("|", 1)
-        if len(parts) < 2:
-            return None, ""
-
-        file_name = parts[0].strip()
-        stats_part = parts[1].strip()
-
-        return file_name, stats_part
-
-    def _extract_insertions_deletions(self, stats_part: str) -> Tuple[int, int]:
-        """Extract insertions and deletions from stats part."""
-        insertions = 0
-        deletions = 0
-
-        logger.debug(f"Extracting from stats part: {stats_part}")
-        for pattern in self._compiled_patterns:
-            stats_match = pattern.search(stats_part)
-            if stats_match:
-                logger.debug(f"Pattern matched: {pattern.pattern}")
-                # If pattern has both groups, use them
-                if len(stats_match.groups()) >= 2:
-                    insertions = int(stats_match.group(1))
-                    deletions = int(stats_match.group(2))
-                    logger.debug(f"Both groups: {insertions}, {deletions}")
-                else:
-                    # Single group pattern
-                    if "insertions" in pattern.pattern:
-                        insertions = int(stats_match.group(1))
-                        logger.debug(f"Insertions only: {insertions}")
-                    if "deletions" in pattern.pattern:
-                        deletions = int(stats_match.group(1))
-                        logger.debug(f"Deletions only: {deletions}")
-
-        logger.debug(f"Final result: {insertions}, {deletions}")
-        return insertions, deletions
-
     def categorize_commit(self, commit: CommitInfo) -> List[str]:
         """Categorize a commit based on its message and changes."""
-        message_lower = commit.message.lower()
-        message_words = set(message_lower.split())
-
-        # Use set intersection for efficient matching
-        categories = []
-        for category, keywords in CategoryPatterns.PATTERNS.items():
-            if keywords & message_words:
-                categories.append(category)
+        # Look each word up in the inverted keyword index, then restore the
+        # CategoryPatterns order so report sections stay stable
+        matched = {
+            category
+            for word in _WORD_RE.findall(commit.message.lower())
+            for category in _KEYWORD_TO_CATEGORIES.get(word, ())
+        }
+        categories = sorted(matched, key=_CATEGORY_ORDER.__getitem__)
 
         # If no categories found, add a default category based on change size
         if not categories:
@@ -581,20 +618,68 @@ class GitLogAnalyzer:
         return self._generate_summary_sync(commits)
 
     def _generate_summary_sync(self, commits: List[CommitInfo]) -> MergeRequestSummary:
-        """Synchronous summary generation."""
-        # Calculate totals
+        """Synchronous summary generation.
+
+        Totals and commit categories are collected in a single pass over the
+        commits; the set of affected files is built separately in C.
+        """
         total_commits = len(commits)
-        total_insertions = sum(c.insertions for c in commits)
-        total_deletions = sum(c.deletions for c in commits)
+        total_insertions = 0
+        total_deletions = 0
+        categorized_commits: Dict[str, List[str]] = {
+            "new_features": [],
+            "bug_fixes": [],
+            "refactoring": [],
+            "breaking_changes": [],
+            "key_changes": [],
+        }
+
+        new_feature_keywords = CategoryPatterns.PATTERNS["new_feature"]
+        bug_fix_keywords = CategoryPatterns.PATTERNS["bug_fix"]
+        refactoring_keywords = CategoryPatterns.PATTERNS["refactoring"]
+        breaking_keywords = CategoryPatterns.BREAKING_KEYWORDS
 
-        # Collect all unique files
-        all_files: Set[str] = set()
         for commit in commits:
-            all_files.update(commit.files_changed)
+            insertions = commit.insertions
+            deletions = commit.deletions
+            total_insertions += insertions
+            total_deletions += deletions
+
+            # Lowercase and tokenize once per commit; the same word set feeds
+            # the category buckets and the breaking-change check
+            message_words = set(_WORD_RE.findall(commit.message.lower()))
+            total_changes = insertions + deletions
+            commit_entry = f"- {commit.message} ({commit.hash[:8]})"
+
+            # Only the first matching bucket is used, so test in priority order
+            if new_feature_keywords & message_words:
+                categorized_commits["new_features"].append(commit_entry)
+            elif bug_fix_keywords & message_words:
+                categorized_commits["bug_fixes"].append(commit_entry)
+            elif refactoring_keywords & message_words:
+                categorized_commits["refactoring"].append(commit_entry)
+
+            # Check for breaking changes
+            if breaking_keywords & message_words:
+                categorized_commits["breaking_changes"].append(commit_entry)
+
+            # Key changes (commits with significant impact)
+            if total_changes > 100:
+                categorized_commits["key_changes"].append(
+                    f"{commit_entry} - {total_changes} lines changed"
+                )
+
+        # Chaining the per-commit lists into the set constructor keeps the
+        # union entirely in C, which beats a set.update call per commit
+        all_files: Set[str] = set(
+            chain.from_iterable(map(attrgetter("files_changed"), commits))
+        )
         total_files_changed = len(all_files)
 
-        # Categorize commits
-        categorized_commits = self._categorize_commits(commits)
+        # Estimate review time
+        estimated_time = self._estimate_review_time(
+            total_commits, total_files_changed, total_insertions + total_deletions
+        )
 
         # Generate title and description
         title = self._generate_title(commits, categorized_commits)
@@ -606,11 +691,7 @@ class GitLogAnalyzer:
             total_deletions,
             categorized_commits,
             all_files,
-        )
-
-        # Estimate review time
-        estimated_time = self._estimate_review_time(
-            total_commits, total_files_changed, total_insertions + total_deletions
+            estimated_time,
         )
 
         return MergeRequestSummary(
@@ -625,46 +706,10 @@ class GitLogAnalyzer:
             new_features=categorized_commits["new_features"],
             bug_fixes=categorized_commits["bug_fixes"],
             refactoring=categorized_commits["refactoring"],
-            files_affected=sorted(list(all_files)),
+            files_affected=sorted(all_files),
             estimated_review_time=estimated_time,
         )
 
-    def _categorize_commits(self, commits: List[CommitInfo]) -> Dict[str, List[str]]:
-        """Categorize commits into different types."""
-        categories = {
-            "new_features": [],
-            "bug_fixes": [],
-            "refactoring": [],
-            "breaking_changes": [],
-            "key_changes": [],
-        }
-
-        for commit in commits:
-            commit_categories = self.categorize_commit(commit)
-            commit_entry = f"- {commit.message} ({commit.hash[:8]})"
-
-            if "new_feature" in commit_categories:
-                categories["new_features"].append(commit_entry)
-            elif "bug_fix" in commit_categories:
-                categories["bug_fixes"].append(commit_entry)
-            elif "refactoring" in commit_categories:
-                categories["refactoring"].append(commit_entry)
-
-            # Check for breaking changes
-            if any(
-                word in commit.message.lower()
-                for word in ["breaking", "deprecate", "remove"]
-            ):
-                categories["breaking_changes"].append(commit_entry)
-
-            # Key changes (commits with significant impact)
-            if commit.insertions + commit.deletions > 100:
-                categories["key_changes"].append(
-                    f"{commit_entry} - {commit.insertions + commit.deletions} lines changed"
-                )
-
-        return categories
-
     def _generate_title(
         self, commits: List[CommitInfo], categorized_commits: Dict[str, List[str]]
     ) -> str:
@@ -691,42 +736,51 @@ class GitLogAnalyzer:
         total_deletions: int,
         categorized_commits: Dict[str, List[str]],
         all_files: Set[str],
+        estimated_time: str,
     ) -> str:
         """Generate a comprehensive description for the merge request."""
-        description = f"""## Overview
-This merge request contains {total_commits} commits with {total_files_changed} files changed ({total_insertions} insertions, {total_deletions} deletions).
-
-## Key Changes
-"""
+        description_parts = [
+            "## Overview\n",
+            f"This merge request contains {total_commits} commits with "
+            f"{total_files_changed} files changed ({total_insertions} insertions, "
+            f"{total_deletions} deletions).\n\n",
+            "## Key Changes\n",
+        ]
 
         if categorized_commits["key_changes"]:
-            description += "\n".join(categorized_commits["key_changes"][:5]) + "\n\n"
+            description_parts.append(
+                "\n".join(categorized_commits["key_changes"][:5]) + "\n\n"
+            )
 
         for category, items in categorized_commits.items():
             if items and category != "key_changes":
                 category_name = category.replace("_", " ").title()
-                description += f"### {category_name} ({len(items)})\n"
-                description += "\n".join(items) + "\n\n"
+                description_parts.append(f"### {category_name} ({len(items)})\n")
+                description_parts.append("\n".join(items) + "\n\n")
 
         # Add file summary
-        description += f"### Files Affected ({len(all_files)})\n"
+        description_parts.append(f"### Files Affected ({len(all_files)})\n")
         file_categories = self._categorize_files(all_files)
         for category, files in file_categories.items():
             if files:
-                description += f"\n**{category}:**\n"
-                for file in files[:10]:  # Limit to 10 files per category
-                    description += f"- `{file}`\n"
+                description_parts.append(f"\n**{category}:**\n")
+                # Limit to 10 files per category
+                description_parts.extend(f"- `{file}`\n" for file in files[:10])
                 if len(files) > 10:
-                    description += f"- ... and {len(files) - 10} more\n"
-
-        description += f"\n### Summary\n"
-        description += f"- **Total Commits:** {total_commits}\n"
-        description += f"- **Files Changed:** {total_files_changed}\n"
-        description += f"- **Lines Added:** {total_insertions}\n"
-        description += f"- **Lines Removed:** {total_deletions}\n"
-        description += f"- **Estimated Review Time:** {self._estimate_review_time(total_commits, total_files_changed, total_insertions + total_deletions)}\n"
+                    description_parts.append(f"- ... and {len(files) - 10} more\n")
+
+        description_parts.extend(
+            [
+                "\n### Summary\n",
+                f"- **Total Commits:** {total_commits}\n",
+                f"- **Files Changed:** {total_files_changed}\n",
+                f"- **Lines Added:** {total_insertions}\n",
+                f"- **Lines Removed:** {total_deletions}\n",
+                f"- **Estimated Review Time:** {estimated_time}\n",
+            ]
+        )
 
-        return description
+        return "".join(description_parts)
 
     def _categorize_files(self, files: Set[str]) -> Dict[str, List[str]]:
         """Categorize files by type."""
@@ -740,38 +794,7 @@ This merge request contains {total_commits} commits with {total_files_changed} f
 
     def _categorize_single_file(self, file: str) -> str:
         """Categorize a single file efficiently."""
-        file_lower = file.lower()
-
-        # Check for special cases first
-        if file == "utils.py":
-            return "Other"
-
-        # Check pattern-based categories first
-        for category, config in FilePatterns.PATTERNS.items():
-            if any(pattern in file_lower for pattern in config["patterns"]):
-                return category
-
-        # Check extensions
-        file_ext = self._get_file_extension(file_lower)
-        for category, config in FilePatterns.PATTERNS.items():
-            if file_ext in config["extensions"]:
-                # Special case: .js and .ts can be both frontend and backend
-                if file_ext in {".js", ".ts"}:
-                    if any(
-                        pattern in file_lower
-                        for pattern in ["component", "page", "view", "ui"]
-                    ):
-                        return "Frontend"
-                    else:
-                        return "Backend"
-                return category
-
-        return "Other"
-
-    def _get_file_extension(self, file_lower: str) -> str:
-        """Get file extension efficiently."""
-        last_dot = file_lower.rfind(".")
-        return file_lower[last_dot:] if last_dot != -1 else ""
+        return _categorize_path(file)
 
     def _estimate_review_time(self, commits: int, files: int, lines: int) -> str:
         """Estimate review time based on changes."""
@@ -783,8 +806,7 @@ This merge request contains {total_commits} commits with {total_files_changed} f
         if total_minutes < 60:
             return f"{total_minutes} minutes"
 
-        hours = total_minutes // 60
-        minutes = total_minutes % 60
+        hours, minutes = divmod(total_minutes, 60)
 
         if minutes == 0:
             return f"{hours}h"
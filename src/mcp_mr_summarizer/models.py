@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class CommitInfo:
     """Represents a single commit with its metadata."""
 
@@ -18,7 +18,7 @@ class CommitInfo:
     branch: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MergeRequestSummary:
     """Represents a complete merge request summary."""
 
@@ -219,10 +219,9 @@ class GitTools:
         )
 
         for i, commit in enumerate(commits):
+            short_hash = commit.hash[:8]
             try:
-                logger.debug(
-                    f"Analyzing commit {i+1}/{len(commits)}: {commit.hash[:8]}"
-                )
+                logger.debug(f"Analyzing commit {i+1}/{len(commits)}: {short_hash}")
 
                 # Update totals
                 analysis.total_insertions += commit.insertions
@@ -233,7 +232,7 @@ class GitTools:
                 for category in categories:
                     analysis.categories[category].append(
                         {
-                            "hash": commit.hash[:8],
+                            "hash": short_hash,
                             "message": commit.message,
                             "insertions": commit.insertions,
                             "deletions": commit.deletions,
@@ -248,7 +247,7 @@ class GitTools:
                 if total_lines > self.config.significant_change_threshold:
                     analysis.significant_changes.append(
                         {
-                            "hash": commit.hash[:8],
+                            "hash": short_hash,
                             "message": commit.message,
                             "total_lines": total_lines,
                         }
@@ -259,7 +258,7 @@ class GitTools:
                 analysis.stats["files_changed"] += len(commit.files_changed)
 
             except Exception as e:
-                logger.warning(f"Error analyzing commit {commit.hash[:8]}: {e}")
+                logger.warning(f"Error analyzing commit {short_hash}: {e}")
                 continue
 
         return analysis
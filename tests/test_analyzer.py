@@ -1,5 +1,8 @@
 """Tests for the GitLogAnalyzer class."""
 
+import subprocess
+import time
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -64,27 +67,73 @@ class TestGitLogAnalyzer:
         categories = self.analyzer.categorize_commit(commit)
         assert "new_feature" in categories
 
-    @pytest.mark.parametrize(
-        "stats_line, expected_insertions, expected_deletions",
-        [
-            ("2 files changed, 10 insertions(+), 5 deletions(-)", 10, 5),
-            ("1 file changed, 1 insertion(+)", 1, 0),
-            ("1 file changed, 1 deletion(-)", 0, 1),
-            ("5 files changed, 100 insertions(+), 200 deletions(-)", 100, 200),
-            ("1 file changed, 0 insertions(+), 0 deletions(-)", 0, 0),
-            ("1 file changed, 1 insertion, 1 deletion", 1, 1),
-        ],
-    )
-    def test_extract_insertions_deletions(
-        self,
-        stats_line,
-        expected_insertions,
-        expected_deletions,
-    ):
-        """Test extraction of insertion and deletion counts from stats line."""
-        insertions, deletions = self.analyzer._extract_insertions_deletions(stats_line)
-        assert insertions == expected_insertions
-        assert deletions == expected_deletions
+    def test_categorize_commit_conventional_prefix(self):
+        """Test that punctuation does not hide a keyword from categorization."""
+        commit = CommitInfo(
+            hash="jkl012",
+            author="Test Author",
+            date="2023-01-01",
+            message="fix: crash on login",
+            files_changed=["auth.py"],
+            insertions=3,
+            deletions=1,
+        )
+
+        assert self.analyzer.categorize_commit(commit) == ["bug_fix"]
+
+    def test_parse_git_output_numstat(self):
+        """Test parsing of NUL-delimited numstat output."""
+        output = (
+            "\x00commit\x00abc1234567890123456789012345678901234567\x00"
+            "Test Author\x002023-01-01\x00Add feature\x00"
+            "\n10\t5\tsrc/main.py\x00"
+            "-\t-\tassets/logo.png\x00"
+            "\x00\x00commit\x00def4567890123456789012345678901234567890\x00"
+            "Test Author\x002023-01-02\x00Rename module\x00"
+            "\n1\t2\t\x00src/old.py\x00src/new.py\x00"
+        )
+
+        commits = self.analyzer._parse_git_output_sync_modern(output.split("\x00"))
+
+        assert len(commits) == 2
+        assert commits[0].files_changed == ["src/main.py", "assets/logo.png"]
+        assert commits[0].insertions == 10
+        assert commits[0].deletions == 5
+        assert commits[1].message == "Rename module"
+        assert commits[1].files_changed == ["src/new.py"]
+        assert commits[1].insertions == 1
+        assert commits[1].deletions == 2
+
+    def test_parse_git_output_empty_commit(self):
+        """Test parsing of a commit without file changes."""
+        output = (
+            "\x00commit\x00abc1234567890123456789012345678901234567\x00"
+            "Test Author\x002023-01-01\x00Empty commit\x00"
+        )
+
+        commits = self.analyzer._parse_git_output_sync_modern(output.split("\x00"))
+
+        assert len(commits) == 1
+        assert commits[0].files_changed == []
+        assert commits[0].insertions == 0
+        assert commits[0].deletions == 0
+
+    def test_parse_git_output_skips_unrecognized_records(self):
+        """Test that a malformed numstat record is skipped, not fatal."""
+        output = (
+            "\x00commit\x00abc1234567890123456789012345678901234567\x00"
+            "Test Author\x002023-01-01\x00Add feature\x00"
+            "\n10\t2\tsrc/feature.py\x00"
+            "unexpected output\x00"
+            "3\t1\tREADME.md\x00"
+        )
+
+        commits = self.analyzer._parse_git_output_sync_modern(output.split("\x00"))
+
+        assert len(commits) == 1
+        assert commits[0].files_changed == ["src/feature.py", "README.md"]
+        assert commits[0].insertions == 13
+        assert commits[0].deletions == 3
 
     def test_categorize_files(self):
         """Test file categorization."""
@@ -208,31 +257,144 @@ class TestGitLogAnalyzer:
         assert "Add new feature" in summary.new_features[0]
         assert "Fix bug in processor" in summary.bug_fixes[0]
 
+    def test_generate_summary_breaking_and_key_changes(self):
+        """Test breaking and key change detection in summary generation."""
+        commits = [
+            CommitInfo(
+                hash="abc1234567",
+                author="Test Author",
+                date="2023-01-01",
+                message="Remove legacy endpoints",
+                files_changed=["api.py", "routes.py"],
+                insertions=20,
+                deletions=130,
+            ),
+            CommitInfo(
+                hash="def4567890",
+                author="Test Author",
+                date="2023-01-01",
+                message="Update docs",
+                files_changed=["README.md", "api.py"],
+                insertions=5,
+                deletions=1,
+            ),
+        ]
+
+        summary = self.analyzer.generate_summary(commits)
+
+        assert summary.total_files_changed == 3
+        assert summary.breaking_changes == ["- Remove legacy endpoints (abc12345)"]
+        assert summary.key_changes == [
+            "- Remove legacy endpoints (abc12345) - 150 lines changed"
+        ]
+        assert summary.files_affected == ["README.md", "api.py", "routes.py"]
+
+    def test_generate_summary_breaking_changes_match_whole_words(self):
+        """Test that breaking-change keywords only match whole words."""
+        commits = [
+            CommitInfo(
+                hash="abc1234567",
+                author="Test Author",
+                date="2023-01-01",
+                message="Removed deprecated login flow",
+                files_changed=["auth.py"],
+                insertions=1,
+                deletions=40,
+            ),
+            CommitInfo(
+                hash="def4567890",
+                author="Test Author",
+                date="2023-01-01",
+                message="Fix removeListener leak",
+                files_changed=["events.py"],
+                insertions=3,
+                deletions=1,
+            ),
+        ]
+
+        summary = self.analyzer.generate_summary(commits)
+
+        assert summary.breaking_changes == [
+            "- Removed deprecated login flow (abc12345)"
+        ]
+
+    def test_generate_summary_breaking_changes_ignore_punctuation(self):
+        """Test that breaking-change markers are found next to punctuation."""
+        messages = [
+            "BREAKING: drop v1 API",
+            "breaking-change: rename config",
+            "Remove: legacy auth",
+        ]
+        commits = [
+            CommitInfo(
+                hash=f"abc{index}234567",
+                author="Test Author",
+                date="2023-01-01",
+                message=message,
+                files_changed=["api.py"],
+                insertions=1,
+                deletions=1,
+            )
+            for index, message in enumerate(messages)
+        ]
+
+        summary = self.analyzer.generate_summary(commits)
+
+        assert summary.breaking_changes == [
+            "- BREAKING: drop v1 API (abc02345)",
+            "- breaking-change: rename config (abc12345)",
+            "- Remove: legacy auth (abc22345)",
+        ]
+
+    def test_generate_summary_buckets_ignore_punctuation(self):
+        """Test that conventional commit prefixes reach the summary buckets."""
+        commits = [
+            CommitInfo(
+                hash="abc1234567",
+                author="Test Author",
+                date="2023-01-01",
+                message="feat: user login",
+                files_changed=["auth.py"],
+                insertions=1,
+                deletions=1,
+            ),
+            CommitInfo(
+                hash="def4567890",
+                author="Test Author",
+                date="2023-01-01",
+                message="fix: session expiry",
+                files_changed=["session.py"],
+                insertions=1,
+                deletions=1,
+            ),
+        ]
+
+        summary = self.analyzer.generate_summary(commits)
+
+        assert summary.new_features == ["- feat: user login (abc12345)"]
+        assert summary.bug_fixes == ["- fix: session expiry (def45678)"]
+
     def test_get_git_log_success(self):
         """Test successful git log retrieval."""
-        mock_log_result = MagicMock()
-        mock_log_result.returncode = 0
-        mock_log_result.stdout = (
-            "abc1234567890123456789012345678901234567\n"
-            "Test Author\n"
-            "2023-01-01\n"
-            "Test commit\n\n"
-            "src/main.py | 10 +++++-----\n"
-            " 1 file changed, 5 insertions(+), 5 deletions(-)\n"
+        log_output = (
+            "\x00commit\x00abc1234567890123456789012345678901234567\x00"
+            "Test Author\x00"
+            "2023-01-01\x00"
+            "Test commit\x00"
+            "\n5\t5\tsrc/main.py\x00"
         )
-        mock_log_result.stderr = ""
 
         # Mock the git command execution to avoid actual git operations
-        with patch.object(self.analyzer, "_execute_git_command") as mock_execute:
-            # First call is for branch validation, second call is for git log
-            mock_execute.side_effect = [
-                MagicMock(
-                    returncode=0, stdout="main\nfeature\n", stderr=""
-                ),  # Branch validation
-                mock_log_result,  # Git log
-            ]
+        with patch.object(
+            self.analyzer, "_execute_git_command"
+        ) as mock_execute, patch.object(
+            self.analyzer, "_stream_git_command"
+        ) as mock_stream:
+            mock_stream.return_value = iter(log_output.split("\x00"))  # Git log
             commits = self.analyzer.get_git_log("main", "feature")
 
+        # Refs are only validated when git log fails
+        mock_execute.assert_not_called()
         assert isinstance(commits, list)
         assert len(commits) == 1
         assert commits[0].hash == "abc1234567890123456789012345678901234567"
@@ -242,19 +404,156 @@ class TestGitLogAnalyzer:
 
     def test_get_git_log_failure(self):
         """Test git log retrieval failure."""
-        mock_log_result = MagicMock()
-        mock_log_result.returncode = 1
-        mock_log_result.stdout = ""
-        mock_log_result.stderr = "fatal: bad revision"
-
         # Mock the git command execution to avoid actual git operations
-        with patch.object(self.analyzer, "_execute_git_command") as mock_execute:
-            # First call is for branch validation, second call is for git log
-            mock_execute.side_effect = [
-                MagicMock(
-                    returncode=0, stdout="main\nfeature\n", stderr=""
-                ),  # Branch validation
-                mock_log_result,  # Git log
-            ]
+        with patch.object(
+            self.analyzer, "_execute_git_command"
+        ) as mock_execute, patch.object(
+            self.analyzer, "_stream_git_command"
+        ) as mock_stream:
+            mock_stream.side_effect = subprocess.CalledProcessError(
+                1, ["git", "log"], stderr="fatal: bad revision"
+            )  # Git log
+            mock_execute.return_value = MagicMock(
+                returncode=0, stdout="", stderr=""
+            )  # Branch validation
             with pytest.raises(Exception, match="Git command failed"):
                 self.analyzer.get_git_log("main", "feature")
+
+    def test_get_git_log_timeout(self):
+        """Test that a git log timeout raises the builtin TimeoutError."""
+        with patch.object(self.analyzer, "_stream_git_command") as mock_stream:
+            mock_stream.side_effect = subprocess.TimeoutExpired(["git", "log"], 30)
+            with pytest.raises(TimeoutError, match="timed out"):
+                self.analyzer.get_git_log("main", "feature")
+
+    def test_get_git_log_git_not_installed(self):
+        """Test that a missing git binary gets a clear error message."""
+        with patch.dict("os.environ", {"PATH": ""}):
+            with pytest.raises(Exception, match="Git command not found"):
+                self.analyzer.get_git_log("main", "feature")
+
+    def test_get_git_log_missing_branch(self):
+        """Test that an unresolvable ref reports the missing branch."""
+        with patch.object(
+            self.analyzer, "_execute_git_command"
+        ) as mock_execute, patch.object(
+            self.analyzer, "_stream_git_command"
+        ) as mock_stream:
+            mock_stream.side_effect = subprocess.CalledProcessError(
+                128, ["git", "log"], stderr="fatal: bad revision 'main..nope'"
+            )  # Git log
+            mock_execute.return_value = MagicMock(
+                returncode=128,
+                stdout="",
+                stderr="fatal: bad revision 'nope^{commit}'\n",
+            )  # Branch validation
+            with pytest.raises(Exception, match="Branch\\(es\\) not found: nope"):
+                self.analyzer.get_git_log("main", "nope")
+
+    def test_validate_repo_path_is_memoized(self, tmp_path):
+        """Test that a validated repository path is not checked again."""
+        (tmp_path / ".git").mkdir()
+        analyzer = GitLogAnalyzer(str(tmp_path))
+
+        analyzer._validate_repo_path()
+        with patch("os.path.exists") as mock_exists:
+            analyzer._validate_repo_path()
+
+        mock_exists.assert_not_called()
+
+    def test_validate_repo_path_missing_git_dir(self, tmp_path):
+        """Test that a directory without .git is rejected."""
+        analyzer = GitLogAnalyzer(str(tmp_path))
+
+        with pytest.raises(ValueError, match="No .git directory found"):
+            analyzer._validate_repo_path()
+
+    def test_stream_git_command(self, tmp_path):
+        """Test streaming NUL-delimited output from a real git command."""
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        (tmp_path / "a.py").write_text("a\n")
+        (tmp_path / "b c.md").write_text("b\n")
+        subprocess.run(["git", "-C", str(tmp_path), "add", "."], check=True)
+        analyzer = GitLogAnalyzer(str(tmp_path))
+
+        tokens = list(analyzer._stream_git_command(["ls-files", "-z"]))
+
+        assert tokens == ["a.py", "b c.md"]
+
+    def test_stream_git_command_failure(self, tmp_path):
+        """Test that a failing streamed git command raises with its stderr."""
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        analyzer = GitLogAnalyzer(str(tmp_path))
+
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            list(analyzer._stream_git_command(["rev-parse", "--verify", "nope"]))
+
+        assert exc_info.value.returncode != 0
+        assert "nope" in exc_info.value.stderr or "fatal" in exc_info.value.stderr
+
+    def test_stream_git_command_timeout(self, tmp_path):
+        """Test that a streamed git command is killed once it times out."""
+        analyzer = GitLogAnalyzer(str(tmp_path))
+        # A shell alias that blocks; exec and the redirect keep the sleep from
+        # holding git's stdout open once git itself is killed
+        cmd = ["-c", "alias.hang=!exec sleep 5 >/dev/null", "hang"]
+
+        start = time.time()
+        with pytest.raises(subprocess.TimeoutExpired):
+            list(analyzer._stream_git_command(cmd, timeout=1))
+
+        assert time.time() - start < 4
+
+    def test_stream_git_command_timeout_after_partial_output(self, tmp_path):
+        """Test that a timeout mid-record raises without yielding the fragment."""
+        analyzer = GitLogAnalyzer(str(tmp_path))
+        cmd = [
+            "-c",
+            "alias.hang=!printf 'msg\\0\\n5'; exec sleep 5 >/dev/null",
+            "hang",
+        ]
+        tokens = []
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            for token in analyzer._stream_git_command(cmd, timeout=1):
+                tokens.append(token)
+
+        assert tokens == ["msg"]
+
+    def test_stream_git_command_failure_after_partial_output(self, tmp_path):
+        """Test that a failure mid-record raises without yielding the fragment."""
+        analyzer = GitLogAnalyzer(str(tmp_path))
+        cmd = ["-c", "alias.fail=!printf 'msg\\0\\n5'; exit 3", "fail"]
+        tokens = []
+
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            for token in analyzer._stream_git_command(cmd):
+                tokens.append(token)
+
+        assert exc_info.value.returncode == 3
+        assert tokens == ["msg"]
+
+    def test_stream_git_command_timer_fires_after_exit(self, tmp_path):
+        """Test that a timer firing after git exits does not report a timeout."""
+
+        class LateTimer:
+            """Timer stand-in that only fires when it is cancelled."""
+
+            def __init__(self, interval, function):
+                self.function = function
+
+            def start(self):
+                pass
+
+            def cancel(self):
+                self.function()
+
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        (tmp_path / "a.py").write_text("a\n")
+        subprocess.run(["git", "-C", str(tmp_path), "add", "."], check=True)
+        analyzer = GitLogAnalyzer(str(tmp_path))
+
+        with patch("mcp_mr_summarizer.analyzer.threading.Timer", LateTimer):
+            tokens = list(analyzer._stream_git_command(["ls-files", "-z"]))
+
+        assert tokens == ["a.py"]
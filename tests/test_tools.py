@@ -6,7 +6,12 @@ from unittest.mock import Mock, patch
 from dataclasses import asdict
 from collections import defaultdict, Counter
 
-from mcp_mr_summarizer.tools import GitTools, GitAnalysisError, AnalysisResult
+from mcp_mr_summarizer.tools import (
+    GitTools,
+    GitAnalysisError,
+    GitTimeoutError,
+    AnalysisResult,
+)
 from mcp_mr_summarizer.models import CommitInfo, MergeRequestSummary
 
 
@@ -166,6 +171,16 @@ class TestGitTools:
                     "main", "feature", "/test/repo"
                 )
 
+    def test_generate_merge_request_summary_timeout(self):
+        """Test that analyzer timeouts surface as GitTimeoutError."""
+        with patch.object(
+            self.tools.analyzer, "get_git_log", side_effect=TimeoutError("timed out")
+        ):
+            with pytest.raises(GitTimeoutError):
+                self.tools.generate_merge_request_summary(
+                    "main", "feature", "/test/repo"
+                )
+
     def test_analyze_git_commits_success(self):
         """Test successful git commits analysis."""
         # Mock commits
@@ -222,6 +237,31 @@ class TestGitTools:
         assert "### Source" in result
         assert "### Tests" in result
 
+    def test_analyze_commits_sync_multiple_categories(self):
+        """Test a commit is listed under every category it matches."""
+        commit = CommitInfo(
+            hash="abc123def456",
+            author="Test Author",
+            date="2023-01-01",
+            message="Fix bug and add tests",
+            files_changed=["src/auth.py"],
+            insertions=20,
+            deletions=5,
+        )
+        self.tools.analyzer.categorize_commit = Mock(return_value=["bug_fix", "test"])
+
+        analysis = self.tools._analyze_commits_sync([commit])
+
+        expected = {
+            "hash": "abc123de",
+            "message": "Fix bug and add tests",
+            "insertions": 20,
+            "deletions": 5,
+        }
+        assert analysis.categories["bug_fix"] == [expected]
+        assert analysis.categories["test"] == [expected]
+        assert analysis.categories["bug_fix"][0] is not analysis.categories["test"][0]
+
     def test_analyze_git_commits_no_commits(self):
         """Test git commits analysis when no commits are found."""
         # Mock the entire get_git_log method to avoid any git operations